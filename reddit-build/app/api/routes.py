@@ -4,6 +4,7 @@ API routes for Reddit Comment Analysis API.
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 import asyncio
+import logging
 from datetime import datetime
 from typing import Dict, Any, List
 
@@ -32,7 +33,6 @@ async def health_check() -> Dict[str, Any]:
     """
     Health check endpoint that returns API status.
     """
-    logger.info("Health check endpoint accessed")
     return {
         "status": "healthy",
         "version": "v2",
@@ -86,7 +86,7 @@ async def analyze_reddit_comments(
         # Collect posts from each subreddit using the SubredditDataCollector
         for subreddit in request.subreddits:
             try:
-                logger.info(f"Collecting posts from r/{subreddit}")
+                logger.info("Collecting posts from r/%s", subreddit)
                 
                 # Create subreddit request
                 subreddit_request = SubredditAnalysisRequest(
@@ -124,7 +124,7 @@ async def analyze_reddit_comments(
                         all_comments.extend(result.analyzed_comments)
                         
             except Exception as e:
-                logger.error(f"Error processing subreddit {subreddit}: {e}")
+                logger.error("Error processing subreddit %s: %s", subreddit, e)
                 continue
 
         processing_time = (datetime.now() - start_time).total_seconds()
@@ -157,7 +157,7 @@ async def analyze_reddit_comments(
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
-        logger.error(f"Error processing legacy analysis request: {str(e)}", exc_info=True)
+        logger.error("Error processing legacy analysis request: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500, detail=f"Analysis processing failed: {str(e)}"
         )
@@ -183,19 +183,22 @@ async def analyze_subreddit(
     Returns:
         UnifiedAnalysisResponse: Comprehensive analysis results with metadata
     """
-    logger.info(f"Subreddit analysis request: r/{request.subreddit}")
+    logger.info("Subreddit analysis request: r/%s", request.subreddit)
 
     try:
         start_time = datetime.now()
         
         # Phase 1: Data Collection
         async with SubredditDataCollector() as collector:
-            logger.info(f"Collecting posts from r/{request.subreddit}")
+            logger.info("Collecting posts from r/%s", request.subreddit)
             
             posts, collection_metadata = await collector.collect_subreddit_posts(request)
             
-            logger.info(f"Collected {len(posts)} posts from r/{request.subreddit}")
-            logger.info(f"Total comments found: {sum(len(post['comments']) for post in posts)}")
+            logger.info("Collected %d posts from r/%s", len(posts), request.subreddit)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Total comments found: %d", sum(len(post["comments"]) for post in posts)
+                )
 
         # Phase 2: AI Analysis & Response Building (via Orchestrator)
         logger.info("Starting AI analysis pipeline via orchestrator")
@@ -212,7 +215,7 @@ async def analyze_subreddit(
         return response
 
     except Exception as e:
-        logger.error(f"Error processing subreddit analysis: {str(e)}", exc_info=True)
+        logger.error("Error processing subreddit analysis: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500, detail=f"Subreddit analysis failed: {str(e)}"
         )
@@ -238,19 +241,22 @@ async def analyze_search(
     Returns:
         UnifiedAnalysisResponse: Comprehensive analysis results with metadata
     """
-    logger.info(f"Search analysis request: {request.query}")
+    logger.info("Search analysis request: %s", request.query)
 
     try:
         start_time = datetime.now()
         
         # Phase 1: Data Collection
         async with SearchDataCollector() as collector:
-            logger.info(f"Searching Reddit for: {request.query}")
+            logger.info("Searching Reddit for: %s", request.query)
             
             posts, collection_metadata = await collector.collect_search_posts(request)
             
-            logger.info(f"Found {len(posts)} posts for query: {request.query}")
-            logger.info(f"Total comments found: {sum(len(post['comments']) for post in posts)}")
+            logger.info("Found %d posts for query: %s", len(posts), request.query)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Total comments found: %d", sum(len(post["comments"]) for post in posts)
+                )
 
         # Phase 2: AI Analysis & Response Building (via Orchestrator)
         logger.info("Starting AI analysis pipeline via orchestrator")
@@ -267,7 +273,7 @@ async def analyze_search(
         return response
 
     except Exception as e:
-        logger.error(f"Error processing search analysis: {str(e)}", exc_info=True)
+        logger.error("Error processing search analysis: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500, detail=f"Search analysis failed: {str(e)}"
         )
@@ -278,8 +284,6 @@ async def api_status() -> Dict[str, Any]:
     """
     Detailed API status endpoint with configuration information.
     """
-    logger.info("Status endpoint accessed")
-
     return {
         "api_status": "operational",
         "version": settings.app_version,
@@ -4,7 +4,7 @@ Configuration management using Pydantic Settings.
 
 from typing import Optional
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -32,6 +32,14 @@ class Settings(BaseSettings):
         default=0.1, 
         description="Delay between Reddit API requests in seconds"
     )
+    reddit_api_max_connections: Optional[int] = Field(
+        default=None,
+        description="Cap on concurrent Reddit API connections for the whole process (None = no cap)"
+    )
+    reddit_api_max_keepalive_connections: int = Field(
+        default=20,
+        description="Idle Reddit API connections kept open for reuse"
+    )
 
     # Application Configuration
     log_level: str = Field(default="INFO", description="Logging level")
@@ -53,11 +61,12 @@ class Settings(BaseSettings):
     # FastAPI Configuration
     app_version: str = Field(default="v2", description="API version")
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        extra = "ignore"  # Ignore extra environment variables
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",  # Ignore extra environment variables
+    )
 
 
 # Global settings instance
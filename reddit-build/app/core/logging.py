@@ -2,15 +2,49 @@
 Centralized logging configuration for Reddit Comment Analysis API.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
 from .config import get_settings
 
+# Background listener that performs the actual handler I/O
+_listener: Optional[QueueListener] = None
+
+
+def shutdown_logging() -> None:
+    """
+    Flush queued records and stop the background listener, if running.
+
+    The listener's handlers are attached directly to the root logger so any
+    records logged afterwards are still written, just synchronously.
+    """
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, QueueHandler):
+            root_logger.removeHandler(handler)
+    for handler in _listener.handlers:
+        root_logger.addHandler(handler)
+    _listener = None
+
 
 def setup_logging() -> None:
     """
     Set up logging configuration for the application.
+
+    Records are pushed onto an in-memory queue by the calling thread and
+    written to the console and file handlers by a background listener, so
+    request handling never blocks on log I/O.
     """
+    global _listener
     settings = get_settings()
 
     # Convert string log level to logging constant
@@ -28,12 +62,26 @@ def setup_logging() -> None:
     console_handler.setFormatter(formatter)
     file_handler.setFormatter(formatter)
 
-    # Configure basic logging with both handlers
+    # Stop any listener left over from a previous call; basicConfig below
+    # then closes its handlers
+    shutdown_logging()
+    log_queue: queue.Queue = queue.Queue(-1)
+    _listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+
+    # The listener's handlers do the real formatting; the queue handler only
+    # merges message args so basicConfig must not attach its default format
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # Configure basic logging with a single non-blocking queue handler
     logging.basicConfig(
         level=log_level,
-        handlers=[console_handler, file_handler],
+        handlers=[queue_handler],
         force=True,  # Override any existing configuration
     )
+    _listener.start()
 
     # Reduce noise from third-party libraries
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -41,6 +89,9 @@ def setup_logging() -> None:
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
 
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the specified name.
@@ -2,16 +2,26 @@
 FastAPI application for Reddit Comment Analysis API.
 """
 
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.requests import ClientDisconnect
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import logging
+import os
+import sys
 import time
-from datetime import datetime
-from typing import Callable, Any
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, NamedTuple, Optional, Tuple, Type
 
 from app.core.config import get_settings
-from app.core.logging import get_logger, setup_logging
+from app.core.logging import get_logger, setup_logging, shutdown_logging
 from app.api.routes import router
+from app.services.reddit_collector import close_shared_client
 from app.core.exceptions import (
     BaseAPIException,
     RedditAPIException,
@@ -27,6 +37,86 @@ settings = get_settings()
 setup_logging()
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Log startup and shutdown information around the application lifetime."""
+    logger.info("🚀 Reddit Comment Analysis API starting up...")
+    logger.info("📍 Version: %s", settings.app_version)
+    logger.info("🔧 Debug mode: %s", settings.debug)
+    logger.info("📊 Log level: %s", settings.log_level)
+    logger.info("🤖 Max concurrent agents: %s", settings.max_concurrent_agents)
+
+    yield
+
+    logger.info("🛑 Reddit Comment Analysis API shutting down...")
+    await close_shared_client()
+    shutdown_logging()
+
+
+# FastAPI documentation endpoints and browser favicon probes, which are not
+# worth a log record per hit
+_UNLOGGED_PATHS = frozenset(
+    {"/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json", "/favicon.ico"}
+)
+
+# Request id of the request being handled, set once by the logging middleware
+_request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def _new_request_id() -> str:
+    """Generate a short random identifier for correlating error responses and logs."""
+    return f"req_{os.urandom(6).hex()}"
+
+
+def _current_request_id() -> str:
+    """Return the id of the current request, generating one if none was assigned."""
+    return _request_id_var.get() or _new_request_id()
+
+
+class RequestLoggingMiddleware:
+    """
+    Pure ASGI middleware that assigns a request id and logs each HTTP request
+    together with its response in a single record.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in _UNLOGGED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        request_id = _new_request_id()
+        _request_id_var.set(request_id)
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            # Log request and response
+            if logger.isEnabledFor(logging.INFO):
+                client = scope.get("client")
+                logger.info(
+                    "Request [%s]: %s %s - Client: %s - Response: %s - Processing time: %.3fs",
+                    request_id,
+                    scope["method"],
+                    scope["path"],
+                    client[0] if client else "unknown",
+                    status_code,
+                    time.perf_counter() - start_time,
+                )
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Reddit Comment Analysis API",
@@ -34,6 +124,7 @@ app = FastAPI(
     version=settings.app_version,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -45,198 +136,217 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON responses; small error bodies stay uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # Request/response logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next: Callable[[Request], Any]) -> Any:
-    """Log all HTTP requests and responses."""
-    start_time = time.time()
-
-    # Log request
-    logger.info(
-        f"Request: {request.method} {request.url.path} - "
-        f"Client: {request.client.host if request.client else 'unknown'}"
-    )
+app.add_middleware(RequestLoggingMiddleware)
 
-    # Process request
-    response = await call_next(request)
 
-    # Log response
-    process_time = time.time() - start_time
-    logger.info(
-        f"Response: {response.status_code} - " f"Processing time: {process_time:.3f}s"
-    )
+# Enhanced Exception Handlers
 
-    return response
+# Last formatted error timestamp as (epoch second, ISO string)
+_cached_timestamp: Tuple[int, str] = (0, "")
+
+
+def _timestamp_now() -> str:
+    """Return the current UTC time as an ISO string, cached at one-second resolution."""
+    global _cached_timestamp
+    second = int(time.time())
+    if _cached_timestamp[0] != second:
+        _cached_timestamp = (
+            second,
+            datetime.fromtimestamp(second, tz=timezone.utc).isoformat(),
+        )
+    return _cached_timestamp[1]
+
+
+def _error_response(
+    request_id: str,
+    error_code: str,
+    message: str,
+    status_code: int,
+    retry_after: Optional[int] = None,
+    headers: Optional[Dict[str, str]] = None,
+    debug_info: Optional[Dict[str, Any]] = None,
+) -> JSONResponse:
+    """Build the JSON error response shared by all exception handlers."""
+    content: Dict[str, Any] = {
+        "error_code": error_code,
+        "message": message,
+        "request_id": request_id,
+        "timestamp": _timestamp_now(),
+    }
+    if retry_after is not None:
+        content["retry_after"] = retry_after
+    if debug_info:
+        content["debug_info"] = debug_info
+
+    return JSONResponse(status_code=status_code, content=content, headers=headers)
+
+
+class _ServiceErrorSpec(NamedTuple):
+    """How a downstream service exception is logged and reported to clients."""
+
+    log_label: str
+    message: str
+    retry_after: Optional[int]
+    # Log "extra" key -> (exception debug_info key, value when the key is absent)
+    log_fields: Dict[str, Tuple[str, Any]]
+
+
+_SERVICE_ERROR_SPECS: Dict[Type[BaseAPIException], _ServiceErrorSpec] = {
+    RedditAPIException: _ServiceErrorSpec(
+        log_label="Reddit API Error",
+        message="Reddit service temporarily unavailable. Please try again later.",
+        retry_after=60,
+        log_fields={"endpoint": ("endpoint", "unknown"), "reddit_response": ("response_code", None)},
+    ),
+    AIAnalysisException: _ServiceErrorSpec(
+        log_label="AI Analysis Error",
+        message="AI analysis service temporarily unavailable. Please try again later.",
+        retry_after=None,
+        log_fields={"model": ("model", "unknown"), "analysis_phase": ("phase", None)},
+    ),
+    DataExtractionException: _ServiceErrorSpec(
+        log_label="Data Extraction Error",
+        message="Unable to process the requested data. Please check your parameters and try again.",
+        retry_after=None,
+        log_fields={"extraction_phase": ("extraction_phase", None), "data_source": ("source", None)},
+    ),
+}
+
+
+def _service_exception_handler(
+    spec: _ServiceErrorSpec,
+) -> Callable[[Request, BaseAPIException], Awaitable[JSONResponse]]:
+    """Create a handler that hides service error details behind a generic message."""
+
+    async def handler(request: Request, exc: BaseAPIException) -> JSONResponse:
+        request_id = _current_request_id()
+
+        if logger.isEnabledFor(logging.ERROR):
+            extra: Dict[str, Any] = {"request_id": request_id, "error_code": exc.error_code}
+            for log_key, (debug_key, default) in spec.log_fields.items():
+                extra[log_key] = exc.debug_info.get(debug_key, default)
+            logger.error("%s [%s]: %s", spec.log_label, request_id, exc.error_code, extra=extra)
+
+        return _error_response(
+            request_id,
+            exc.error_code,
+            spec.message,
+            exc.status_code,
+            retry_after=spec.retry_after,
+            headers={"Retry-After": str(spec.retry_after)} if spec.retry_after else None,
+        )
+
+    return handler
+
+
+for _exc_class, _spec in _SERVICE_ERROR_SPECS.items():
+    app.add_exception_handler(_exc_class, _service_exception_handler(_spec))
 
 
-# Enhanced Exception Handlers
 @app.exception_handler(BaseAPIException)
 async def api_exception_handler(request: Request, exc: BaseAPIException) -> JSONResponse:
     """Handle custom API exceptions with detailed logging."""
-    request_id = f"req_{int(time.time() * 1000)}"
-    
-    logger.error(
-        f"API Exception [{request_id}]: {exc.error_code} - {exc.detail['message']}",
-        extra={
-            "request_id": request_id,
-            "error_code": exc.error_code,
-            "endpoint": str(request.url.path),
-            "method": request.method,
-            "debug_info": exc.debug_info,
-        }
-    )
-    
-    response_content = {
-        "error_code": exc.error_code,
-        "message": exc.detail["message"],
-        "request_id": request_id,
-        "timestamp": datetime.now().isoformat(),
-    }
-    
-    # Add debug info in development mode only
-    if settings.debug and exc.debug_info:
-        response_content["debug_info"] = exc.debug_info
-    
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=response_content,
-        headers=exc.headers or {}
-    )
-
-
-@app.exception_handler(RedditAPIException)
-async def reddit_api_exception_handler(request: Request, exc: RedditAPIException) -> JSONResponse:
-    """Handle Reddit API specific exceptions."""
-    request_id = f"req_{int(time.time() * 1000)}"
-    
-    logger.error(
-        f"Reddit API Error [{request_id}]: {exc.error_code}",
-        extra={
-            "request_id": request_id,
-            "error_code": exc.error_code,
-            "endpoint": exc.debug_info.get("endpoint", "unknown"),
-            "reddit_response": exc.debug_info.get("response_code"),
-        }
-    )
-    
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error_code": exc.error_code,
-            "message": "Reddit service temporarily unavailable. Please try again later.",
-            "request_id": request_id,
-            "timestamp": datetime.now().isoformat(),
-            "retry_after": 60,
-        },
-        headers={"Retry-After": "60"}
-    )
-
-
-@app.exception_handler(AIAnalysisException)
-async def ai_analysis_exception_handler(request: Request, exc: AIAnalysisException) -> JSONResponse:
-    """Handle AI analysis specific exceptions."""
-    request_id = f"req_{int(time.time() * 1000)}"
-    
-    logger.error(
-        f"AI Analysis Error [{request_id}]: {exc.error_code}",
-        extra={
-            "request_id": request_id,
-            "error_code": exc.error_code,
-            "model": exc.debug_info.get("model", "unknown"),
-            "analysis_phase": exc.debug_info.get("phase"),
-        }
-    )
-    
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error_code": exc.error_code,
-            "message": "AI analysis service temporarily unavailable. Please try again later.",
-            "request_id": request_id,
-            "timestamp": datetime.now().isoformat(),
-        }
-    )
-
-
-@app.exception_handler(DataExtractionException)
-async def data_extraction_exception_handler(request: Request, exc: DataExtractionException) -> JSONResponse:
-    """Handle data extraction specific exceptions."""
-    request_id = f"req_{int(time.time() * 1000)}"
-    
-    logger.error(
-        f"Data Extraction Error [{request_id}]: {exc.error_code}",
-        extra={
-            "request_id": request_id,
-            "error_code": exc.error_code,
-            "extraction_phase": exc.debug_info.get("extraction_phase"),
-            "data_source": exc.debug_info.get("source"),
-        }
-    )
-    
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error_code": exc.error_code,
-            "message": "Unable to process the requested data. Please check your parameters and try again.",
-            "request_id": request_id,
-            "timestamp": datetime.now().isoformat(),
-        }
+    request_id = _current_request_id()
+
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "API Exception [%s]: %s - %s",
+            request_id,
+            exc.error_code,
+            exc.detail["message"],
+            extra={
+                "request_id": request_id,
+                "error_code": exc.error_code,
+                "endpoint": request.scope["path"],
+                "method": request.method,
+                "debug_info": exc.debug_info,
+            }
+        )
+
+    return _error_response(
+        request_id,
+        exc.error_code,
+        exc.detail["message"],
+        exc.status_code,
+        headers=exc.headers or {},
+        # Add debug info in development mode only
+        debug_info=exc.debug_info if settings.debug else None,
     )
 
 
 @app.exception_handler(RateLimitException)
 async def rate_limit_exception_handler(request: Request, exc: RateLimitException) -> JSONResponse:
     """Handle rate limiting exceptions."""
-    request_id = f"req_{int(time.time() * 1000)}"
-    
-    logger.warning(
-        f"Rate Limit Exceeded [{request_id}]: {exc.error_code}",
-        extra={
-            "request_id": request_id,
-            "error_code": exc.error_code,
-            "service": exc.debug_info.get("service"),
-            "retry_after": exc.retry_after,
-        }
-    )
-    
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error_code": exc.error_code,
-            "message": f"Rate limit exceeded. Please try again in {exc.retry_after} seconds.",
-            "request_id": request_id,
-            "timestamp": datetime.now().isoformat(),
-            "retry_after": exc.retry_after,
-        },
-        headers={"Retry-After": str(exc.retry_after)}
+    request_id = _current_request_id()
+
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "Rate Limit Exceeded [%s]: %s",
+            request_id,
+            exc.error_code,
+            extra={
+                "request_id": request_id,
+                "error_code": exc.error_code,
+                "service": exc.debug_info.get("service"),
+                "retry_after": exc.retry_after,
+            }
+        )
+
+    return _error_response(
+        request_id,
+        exc.error_code,
+        f"Rate limit exceeded. Please try again in {exc.retry_after} seconds.",
+        exc.status_code,
+        retry_after=exc.retry_after,
+        headers={"Retry-After": str(exc.retry_after)},
     )
 
 
+# Exceptions caused by the client going away rather than by a bug
+_DISCONNECT_EXCEPTIONS = (
+    ClientDisconnect,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle unexpected exceptions globally with enhanced logging."""
-    request_id = f"req_{int(time.time() * 1000)}"
-    
-    logger.error(
-        f"Unhandled Exception [{request_id}]: {type(exc).__name__} - {str(exc)}",
-        exc_info=True,
-        extra={
-            "request_id": request_id,
-            "endpoint": str(request.url.path),
-            "method": request.method,
-            "exception_type": type(exc).__name__,
-        }
-    )
-    
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error_code": "INTERNAL_001",
-            "message": "An unexpected error occurred. Please try again later.",
-            "request_id": request_id,
-            "timestamp": datetime.now().isoformat(),
-        },
+    request_id = _current_request_id()
+    # Client disconnects are not bugs; skip the traceback
+    expected = isinstance(exc, _DISCONNECT_EXCEPTIONS)
+    level = logging.WARNING if expected else logging.ERROR
+
+    if logger.isEnabledFor(level):
+        logger.log(
+            level,
+            "Unhandled Exception [%s]: %s - %s",
+            request_id,
+            type(exc).__name__,
+            exc,
+            exc_info=not expected,
+            extra={
+                "request_id": request_id,
+                "endpoint": request.scope["path"],
+                "method": request.method,
+                "exception_type": type(exc).__name__,
+            }
+        )
+
+    # Unhandled exceptions are answered by ServerErrorMiddleware, outside the
+    # logging middleware, so the request id header has to be set here
+    return _error_response(
+        request_id,
+        "INTERNAL_001",
+        "An unexpected error occurred. Please try again later.",
+        500,
+        headers={"X-Request-ID": request_id},
     )
 
 
@@ -244,24 +354,6 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
 app.include_router(router)
 
 
-# Startup event
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Log startup information."""
-    logger.info("🚀 Reddit Comment Analysis API starting up...")
-    logger.info(f"📍 Version: {settings.app_version}")
-    logger.info(f"🔧 Debug mode: {settings.debug}")
-    logger.info(f"📊 Log level: {settings.log_level}")
-    logger.info(f"🤖 Max concurrent agents: {settings.max_concurrent_agents}")
-
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Log shutdown information."""
-    logger.info("🛑 Reddit Comment Analysis API shutting down...")
-
-
 # Development mode startup check
 if __name__ == "__main__":
     import uvicorn
@@ -279,5 +371,8 @@ if __name__ == "__main__":
         port=settings.port,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
+        # uvloop is not available on Windows; fall back to the stdlib loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
  
\ No newline at end of file
@@ -61,9 +61,6 @@ class CommentAnalysis(BaseModel):
         le=1.0
     )
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
 
 class PostWithComments(BaseModel):
     """Post with all its comments after cleaning"""
@@ -179,9 +176,6 @@ class AnalysisMetadata(BaseModel):
         description="Whether enhanced JSON context analysis was used"
     )
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
 
 class UnifiedAnalysisResponse(BaseModel):
     """Model for unified analysis response."""
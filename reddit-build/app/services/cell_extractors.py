@@ -3,10 +3,57 @@ Cell-based data extraction functions for Reddit subreddit/search responses.
 Handles the complex CellGroup structure from Reddit's subreddit/search API.
 """
 
+import logging
 import re
-from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+from app.services.timestamps import reddit_timestamp_to_epoch
+
+logger = logging.getLogger(__name__)
+
+
+def _extract_metadata_cell(cell: Dict[str, Any], post_data: Dict[str, Any]) -> None:
+    """Extract author and creation date"""
+    author_name = cell.get("authorName", "")
+    if author_name.startswith("u/"):
+        post_data["author"] = author_name[2:]  # Remove u/ prefix
+    
+    created_at = cell.get("createdAt")
+    if created_at:
+        try:
+            # Convert ISO format to Unix timestamp
+            post_data["created_utc"] = reddit_timestamp_to_epoch(created_at)
+        except Exception as e:
+            logger.warning("Error parsing date %s: %s", created_at, e)
+
+
+def _extract_title_cell(cell: Dict[str, Any], post_data: Dict[str, Any]) -> None:
+    """Extract post title"""
+    post_data["title"] = cell.get("title", "")
+
+
+def _extract_action_cell(cell: Dict[str, Any], post_data: Dict[str, Any]) -> None:
+    """Extract score and comment count"""
+    post_data["score"] = cell.get("score", 0)
+    post_data["num_comments"] = cell.get("commentCount", 0)
+
+
+def _extract_media_cell(cell: Dict[str, Any], post_data: Dict[str, Any]) -> None:
+    """For media posts, extract subreddit if available"""
+    subreddit_visual = cell.get("subredditVisualName", "")
+    if subreddit_visual:
+        post_data["subreddit"] = subreddit_visual
+
+
+# Cell handlers keyed by __typename; other cell types carry nothing we keep
+_CELL_HANDLERS = {
+    "MetadataCell": _extract_metadata_cell,
+    "TitleCell": _extract_title_cell,
+    "ActionCell": _extract_action_cell,
+    "LegacyVideoCell": _extract_media_cell,
+    "ImageCell": _extract_media_cell,
+}
+
 
 def extract_posts_from_reddit_response(api_response: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
@@ -41,7 +88,7 @@ def extract_post_from_cells(group_id: str, cells: List[Dict[str, Any]]) -> Optio
     Extract post information from Reddit cell structure
     """
     post_data = {
-        "id": group_id.replace("t3_", ""),  # Remove t3_ prefix
+        "id": group_id.removeprefix("t3_"),
         "title": "",
         "selftext": "",
         "author": "",
@@ -54,37 +101,9 @@ def extract_post_from_cells(group_id: str, cells: List[Dict[str, Any]]) -> Optio
     }
     
     for cell in cells:
-        cell_type = cell.get("__typename", "")
-        
-        if cell_type == "MetadataCell":
-            # Extract author and creation date
-            author_name = cell.get("authorName", "")
-            if author_name.startswith("u/"):
-                post_data["author"] = author_name[2:]  # Remove u/ prefix
-            
-            created_at = cell.get("createdAt")
-            if created_at:
-                try:
-                    # Convert ISO format to Unix timestamp
-                    dt = datetime.fromisoformat(created_at.replace("+0000", "+00:00"))
-                    post_data["created_utc"] = int(dt.timestamp())
-                except Exception as e:
-                    print(f"Error parsing date {created_at}: {e}")
-                    
-        elif cell_type == "TitleCell":
-            # Extract post title
-            post_data["title"] = cell.get("title", "")
-            
-        elif cell_type == "ActionCell":
-            # Extract score and comment count
-            post_data["score"] = cell.get("score", 0)
-            post_data["num_comments"] = cell.get("commentCount", 0)
-            
-        elif cell_type in ["LegacyVideoCell", "ImageCell"]:
-            # For media posts, extract subreddit if available
-            subreddit_visual = cell.get("subredditVisualName", "")
-            if subreddit_visual:
-                post_data["subreddit"] = subreddit_visual
+        handler = _CELL_HANDLERS.get(cell.get("__typename", ""))
+        if handler:
+            handler(cell, post_data)
     
     # Generate permalink and URL
     if post_data["id"] and post_data["subreddit"]:
@@ -106,61 +125,65 @@ def filter_content_types(api_response: Dict[str, Any]) -> Dict[str, Any]:
     """
     Filter out ads and recommendations from API response
     """
+    data = api_response.get("data", [])
     filtered_data = []
     
-    for item in api_response.get("data", []):
+    for item in data:
         # Keep only CellGroup items without ads
         if (item.get("__typename") == "CellGroup" and 
             item.get("adPayload") is None):
             filtered_data.append(item)
     
+    # Nothing was dropped, so the response can be returned as is
+    if "data" in api_response and len(filtered_data) == len(data):
+        return api_response
+    
     return {
         **api_response,
         "data": filtered_data
     }
 
 
+# Bit per required cell type, in the order they are reported
+_REQUIRED_CELL_BITS = {"MetadataCell": 1, "TitleCell": 2, "ActionCell": 4}
+
+
 def validate_cell_structure(cells: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Validate that required cells are present and well-formed (for cell-based responses)
     """
-    validation_result = {
-        "is_valid": True,
-        "errors": [],
-        "warnings": [],
-        "required_cells_found": {
-            "MetadataCell": False,
-            "TitleCell": False,
-            "ActionCell": False
-        }
-    }
+    errors = []
+    warnings = []
+    found = 0
     
     for cell in cells:
         cell_type = cell.get("__typename", "")
-        
-        if cell_type in validation_result["required_cells_found"]:
-            validation_result["required_cells_found"][cell_type] = True
+        found |= _REQUIRED_CELL_BITS.get(cell_type, 0)
         
         # Validate cell-specific requirements
         if cell_type == "MetadataCell":
             if not cell.get("authorName"):
-                validation_result["warnings"].append("MetadataCell missing authorName")
+                warnings.append("MetadataCell missing authorName")
             if not cell.get("createdAt"):
-                validation_result["warnings"].append("MetadataCell missing createdAt")
+                warnings.append("MetadataCell missing createdAt")
                 
         elif cell_type == "TitleCell":
             if not cell.get("title"):
-                validation_result["errors"].append("TitleCell missing title")
-                validation_result["is_valid"] = False
+                errors.append("TitleCell missing title")
     
     # Check if all required cells are present
-    missing_required = [
-        cell_type for cell_type, found in validation_result["required_cells_found"].items()
-        if not found
-    ]
-    
-    if missing_required:
-        validation_result["errors"].extend([f"Missing required cell: {ct}" for ct in missing_required])
-        validation_result["is_valid"] = False
+    required_cells_found = {
+        cell_type: bool(found & bit) for cell_type, bit in _REQUIRED_CELL_BITS.items()
+    }
+    errors.extend(
+        f"Missing required cell: {cell_type}"
+        for cell_type, bit in _REQUIRED_CELL_BITS.items()
+        if not found & bit
+    )
     
-    return validation_result 
\ No newline at end of file
+    return {
+        "is_valid": not errors,
+        "errors": errors,
+        "warnings": warnings,
+        "required_cells_found": required_cells_found
+    }
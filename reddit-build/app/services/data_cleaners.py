@@ -5,9 +5,31 @@ Works with both cell-based and flat object extraction formats.
 
 from datetime import datetime
 from typing import Dict, Any, List, Optional
+import logging
 import re
 import json
-import traceback
+
+from app.services.timestamps import parse_reddit_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Patterns used by the content cleaners, compiled once at import
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+_JS_URL_RE = re.compile(r'javascript:', re.IGNORECASE)
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.*?)\*')
+_STRIKE_RE = re.compile(r'~~(.*?)~~')
+_WS_RE = re.compile(r'\s+')
+
+# HTML entities Reddit uses in comment HTML, decoded in a single pass
+_HTML_ENTITIES = {'&lt;': '<', '&gt;': '>', '&amp;': '&', '&#39;': "'", '&quot;': '"'}
+_HTML_ENTITY_RE = re.compile(r'&(?:lt|gt|amp|#39|quot);')
+
+
+def _decode_html_entity(match: re.Match) -> str:
+    """Map a matched HTML entity to its character."""
+    return _HTML_ENTITIES[match.group()]
 
 
 def clean_reddit_post_updated(extracted_post: Dict[str, Any]) -> Dict[str, Any]:
@@ -41,28 +63,28 @@ def clean_posts_comments_response(api_response: Dict[str, Any]) -> List[Dict[str
     try:
         # Handle None or empty api_response
         if not api_response or not isinstance(api_response, dict):
-            print("API response is None or not a dict")
+            logger.debug("API response is None or not a dict")
             return []
     
         # Extract data object with null safety
         data = api_response.get("data")
         if not data or not isinstance(data, dict):
-            print("API response data is None or not a dict")
+            logger.debug("API response data is None or not a dict")
             return []
             
         # Extract comment forest with null safety
         comment_forest = data.get("commentForest")
         if not comment_forest or not isinstance(comment_forest, dict):
-            print("Comment forest is None or not a dict")
+            logger.debug("Comment forest is None or not a dict")
             return []
         
         # Extract trees array with null safety
         trees = comment_forest.get("trees")
         if not trees or not isinstance(trees, list):
-            print("Trees is None or not a list")
+            logger.debug("Trees is None or not a list")
             return []
         
-        print(f"Processing {len(trees)} trees from comment forest")
+        logger.debug("Processing %d trees from comment forest", len(trees))
         
         # Build a dict of all comments keyed by id
         comments = {}
@@ -72,19 +94,19 @@ def clean_posts_comments_response(api_response: Dict[str, Any]) -> List[Dict[str
             try:
                 # Validate tree object
                 if not tree or not isinstance(tree, dict):
-                    print(f"Tree {i} is None or not a dict, skipping")
+                    logger.debug("Tree %d is None or not a dict, skipping", i)
                     continue
                 
                 # Skip "more comments" placeholders (they have node: null)
                 node = tree.get("node")
                 if not node or not isinstance(node, dict):
-                    print(f"Tree {i} has None or invalid node, skipping")
+                    logger.debug("Tree %d has None or invalid node, skipping", i)
                     continue
                 
                 # Extract comment ID with null safety
                 comment_id = node.get("id")
                 if not comment_id or not isinstance(comment_id, str):
-                    print(f"Tree {i} node missing valid ID, skipping")
+                    logger.debug("Tree %d node missing valid ID, skipping", i)
                     continue
         
                 # Extract comment content with null safety
@@ -112,9 +134,9 @@ def clean_posts_comments_response(api_response: Dict[str, Any]) -> List[Dict[str
                 comment_date = datetime.utcnow()
                 if created_at and isinstance(created_at, str):
                     try:
-                        comment_date = datetime.fromisoformat(created_at.replace("+0000", "+00:00"))
+                        comment_date = parse_reddit_timestamp(created_at)
                     except Exception as date_error:
-                        print(f"Date parsing error for comment {comment_id}: {date_error}")
+                        logger.debug("Date parsing error for comment %s: %s", comment_id, date_error)
                         pass
                 
                 # Extract score with null safety
@@ -145,27 +167,26 @@ def clean_posts_comments_response(api_response: Dict[str, Any]) -> List[Dict[str
                 processed_count += 1
                 
             except Exception as tree_error:
-                print(f"Error processing tree {i}: {tree_error}")
+                logger.warning("Error processing tree %d: %s", i, tree_error)
                 continue
         
-        print(f"Successfully processed {processed_count} comments out of {len(trees)} trees")
+        logger.debug("Successfully processed %d comments out of %d trees", processed_count, len(trees))
     
         # Build nested structure by attaching children to parents
         roots = []
         for comment in comments.values():
-            parent_id = comment["parentId"]
-            if parent_id and parent_id in comments:
-                comments[parent_id]["children"].append(comment)
+            parent = comments.get(comment["parentId"])
+            if parent is not None:
+                parent["children"].append(comment)
             else:
                 roots.append(comment)
     
-        print(f"Built comment tree with {len(roots)} root comments")
+        logger.debug("Built comment tree with %d root comments", len(roots))
         return roots
         
     except Exception as e:
         # Log error and return empty list instead of None
-        print(f"Error processing comments response: {e}")
-        traceback.print_exc()
+        logger.error("Error processing comments response: %s", e, exc_info=True)
         return []
 
 
@@ -177,17 +198,21 @@ def extract_comment_content(content_obj: Dict[str, Any]) -> str:
         return ""
     
     # Priority order: markdown > preview > html > empty
-    content_formats = ["markdown", "preview", "html"]
+    markdown = (content_obj.get("markdown") or "").strip()
+    if markdown:
+        return markdown
+    
+    preview = (content_obj.get("preview") or "").strip()
+    if preview:
+        return preview
     
-    for format_name in content_formats:
-        content = content_obj.get(format_name, "")
-        if content and content.strip():
-            # Clean HTML tags if present
-            if format_name == "html":
-                content = re.sub(r'<[^>]+>', '', content)
-                content = content.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-                content = content.replace('&#39;', "'").replace('&quot;', '"')
-            return content.strip()
+    html = content_obj.get("html")
+    if html and html.strip():
+        # Clean HTML tags and entities
+        html = _HTML_TAG_RE.sub('', html)
+        if '&' in html:
+            html = _HTML_ENTITY_RE.sub(_decode_html_entity, html)
+        return html.strip()
     
     return ""
 
@@ -215,7 +240,7 @@ def clean_reddit_comment_tree_legacy(raw_comment_trees: List[Dict[str, Any]]) ->
             "body": node.get("content", {}).get("markdown", "") or node.get("body", ""),
             "score": node.get("score", 0),
             "date": (
-                datetime.fromisoformat(node["createdAt"])
+                parse_reddit_timestamp(node["createdAt"])
                 if "createdAt" in node and node["createdAt"]
                 else datetime.utcnow()
             ),
@@ -227,9 +252,9 @@ def clean_reddit_comment_tree_legacy(raw_comment_trees: List[Dict[str, Any]]) ->
     # Attach each comment to its parent's 'children'
     roots = []
     for comment in comments.values():
-        parent_id = comment["parentId"]
-        if parent_id and parent_id in comments:
-            comments[parent_id]["children"].append(comment)
+        parent = comments.get(comment["parentId"])
+        if parent is not None:
+            parent["children"].append(comment)
         else:
             roots.append(comment)
     
@@ -290,16 +315,19 @@ def sanitize_reddit_content(content: str) -> str:
         return ""
     
     # Remove potential XSS content
-    content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.IGNORECASE | re.DOTALL)
-    content = re.sub(r'javascript:', '', content, flags=re.IGNORECASE)
+    content = _SCRIPT_RE.sub('', content)
+    content = _JS_URL_RE.sub('', content)
     
-    # Clean up common Reddit formatting artifacts
-    content = re.sub(r'\*\*(.*?)\*\*', r'\1', content)  # Remove bold markdown
-    content = re.sub(r'\*(.*?)\*', r'\1', content)  # Remove italic markdown
-    content = re.sub(r'~~(.*?)~~', r'\1', content)  # Remove strikethrough
+    # Clean up common Reddit formatting artifacts; most comments have none,
+    # so only scan for a marker that is actually present
+    if '*' in content:
+        content = _BOLD_RE.sub(r'\1', content)  # Remove bold markdown
+        content = _ITALIC_RE.sub(r'\1', content)  # Remove italic markdown
+    if '~~' in content:
+        content = _STRIKE_RE.sub(r'\1', content)  # Remove strikethrough
     
     # Normalize whitespace
-    content = re.sub(r'\s+', ' ', content)
+    content = _WS_RE.sub(' ', content)
     content = content.strip()
     
     return content 
\ No newline at end of file
@@ -4,12 +4,14 @@ Handles all Reddit API communication with authentication, rate limiting, and err
 """
 
 import asyncio
-import json
 import logging
+import weakref
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from time import perf_counter
 
 import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app.core.config import get_settings
@@ -21,6 +23,52 @@ from app.core.exceptions import RedditAPIException, DataExtractionException
 
 logger = logging.getLogger(__name__)
 
+# HTTP clients shared by all collectors so connections and TLS sessions are
+# reused across requests. A client's connections belong to the event loop it
+# was created on, so there is one client per loop; entries for loops that
+# are garbage collected drop out on their own.
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_shared_client(
+    headers: Dict[str, str],
+    timeout: float,
+    max_connections: Optional[int],
+    max_keepalive_connections: int,
+) -> httpx.AsyncClient:
+    """Return the running event loop's shared Reddit API client, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        # Forget clients of loops that have been closed; their transports are
+        # already gone, and clients of other running loops are left alone
+        for stale_loop in [l for l in _shared_clients if l.is_closed()]:
+            del _shared_clients[stale_loop]
+        client = httpx.AsyncClient(
+            headers=headers,
+            # Waiting for a free connection is queueing, not a Reddit failure,
+            # so it must not raise PoolTimeout and trigger retries
+            timeout=httpx.Timeout(timeout, pool=None),
+            # One client serves every concurrent analysis request, so the
+            # connection cap is process-wide and unbounded unless configured
+            limits=httpx.Limits(
+                max_keepalive_connections=max_keepalive_connections,
+                max_connections=max_connections,
+            )
+        )
+        _shared_clients[loop] = client
+        logger.info("Reddit API client initialized successfully")
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the running event loop's shared Reddit API client. Called on application shutdown."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class BaseRedditDataCollector:
     """
@@ -46,8 +94,8 @@ class BaseRedditDataCollector:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.client:
-            await self.client.aclose()
+        # The client is shared with other collectors and closed on app shutdown
+        self.client = None
     
     async def _init_client(self):
         """Initialize the HTTP client with proper configuration"""
@@ -57,12 +105,12 @@ class BaseRedditDataCollector:
                 debug_info={"config_check": "rapid_api_key_missing"}
             )
         
-        self.client = httpx.AsyncClient(
-            headers=self.headers,
-            timeout=httpx.Timeout(self.settings.reddit_api_timeout),
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
+        self.client = _get_shared_client(
+            self.headers,
+            self.settings.reddit_api_timeout,
+            self.settings.reddit_api_max_connections,
+            self.settings.reddit_api_max_keepalive_connections,
         )
-        logger.info("Reddit API client initialized successfully")
     
     @retry(
         stop=stop_after_attempt(3),
@@ -138,8 +186,8 @@ class BaseRedditDataCollector:
             
             # Parse JSON response
             try:
-                data = response.json()
-                logger.info(f"Request successful to {endpoint}. Response size: {len(str(data))}")
+                data = orjson.loads(response.content)
+                logger.info("Request successful to %s. Response size: %d bytes", endpoint, len(response.content))
                 
                 # Check if response has expected data structure
                 if not isinstance(data, dict):
@@ -155,7 +203,7 @@ class BaseRedditDataCollector:
                 
                 return data
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse JSON response from {endpoint}: {e}")
                 raise RedditAPIException(
                     message="Invalid JSON response from Reddit API",
@@ -332,7 +380,7 @@ class BaseRedditDataCollector:
         all_posts = []
         after_token = None
         requests_made = 0
-        start_time = datetime.now()
+        start_time = perf_counter()
         
         while len(all_posts) < total_limit:
             # Calculate remaining posts needed
@@ -370,7 +418,7 @@ class BaseRedditDataCollector:
         
         # Calculate metadata
         end_time = datetime.now()
-        processing_time = (end_time - start_time).total_seconds()
+        processing_time = perf_counter() - start_time
         
         metadata = {
             "total_posts_collected": len(all_posts),
@@ -422,7 +470,7 @@ class SubredditDataCollector(BaseRedditDataCollector):
         Returns:
             Tuple of (list of PostWithComments, collection metadata)
         """
-        start_time = datetime.now()
+        start_time = perf_counter()
         collection_errors = []
         total_api_calls = 0
         
@@ -485,7 +533,7 @@ class SubredditDataCollector(BaseRedditDataCollector):
             
             # Step 4: Calculate collection metadata
             end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = perf_counter() - start_time
             
             metadata = {
                 "total_posts_analyzed": len(extracted_posts),
@@ -537,7 +585,7 @@ class SearchDataCollector(BaseRedditDataCollector):
         Returns:
             Tuple of (list of PostWithComments, collection metadata)
         """
-        start_time = datetime.now()
+        start_time = perf_counter()
         collection_errors = []
         total_api_calls = 0
         
@@ -601,7 +649,7 @@ class SearchDataCollector(BaseRedditDataCollector):
             
             # Step 4: Calculate collection metadata
             end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = perf_counter() - start_time
             
             metadata = {
                 "total_posts_analyzed": len(extracted_posts),
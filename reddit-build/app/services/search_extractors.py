@@ -3,9 +3,14 @@ Flat object data extraction functions for Reddit posts/search-posts responses.
 Handles the simple SubredditPost structure from Reddit's search API.
 """
 
-from datetime import datetime
+import logging
+import re
 from typing import Dict, Any, List, Optional
 
+from app.services.timestamps import reddit_timestamp_to_epoch
+
+logger = logging.getLogger(__name__)
+
 
 def extract_posts_from_search_response(api_response: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
@@ -51,10 +56,9 @@ def extract_search_post_data(post_item: Dict[str, Any]) -> Optional[Dict[str, An
     created_at = post_item.get("createdAt")
     if created_at:
         try:
-            dt = datetime.fromisoformat(created_at.replace("+0000", "+00:00"))
-            created_utc = int(dt.timestamp())
+            created_utc = reddit_timestamp_to_epoch(created_at)
         except Exception as e:
-            print(f"Error parsing date {created_at}: {e}")
+            logger.warning("Error parsing date %s: %s", created_at, e)
     
     post_data = {
         "id": post_id,
@@ -93,7 +97,6 @@ def extract_post_content(content_obj: Dict[str, Any]) -> str:
         if content and content.strip():
             # Clean HTML tags if present
             if format_name == "html":
-                import re
                 content = re.sub(r'<[^>]+>', '', content)
                 content = content.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
                 content = content.replace('&#39;', "'").replace('&quot;', '"')
@@ -0,0 +1,31 @@
+"""
+Parsing of Reddit's createdAt timestamps, shared by the extractors and cleaners.
+"""
+
+from datetime import datetime, timezone
+
+
+def parse_reddit_timestamp(created_at: str) -> datetime:
+    """
+    Parse a Reddit createdAt string into a datetime.
+    Reddit's own "YYYY-MM-DDTHH:MM:SS[.ffffff]+0000" shape is sliced straight into
+    a UTC datetime; anything else goes through datetime.fromisoformat.
+    Raises ValueError if the string is not a valid timestamp.
+    """
+    if created_at.endswith("+0000") and created_at[10:11] == "T":
+        fraction = created_at[20:-5] if created_at[19:20] == "." else ""
+        return datetime(
+            int(created_at[0:4]), int(created_at[5:7]), int(created_at[8:10]),
+            int(created_at[11:13]), int(created_at[14:16]), int(created_at[17:19]),
+            int(fraction[:6].ljust(6, "0")) if fraction else 0,
+            timezone.utc,
+        )
+    return datetime.fromisoformat(created_at.replace("+0000", "+00:00"))
+
+
+def reddit_timestamp_to_epoch(created_at: str) -> int:
+    """
+    Convert a Reddit createdAt string into whole Unix seconds.
+    Raises ValueError if the string is not a valid timestamp.
+    """
+    return int(parse_reddit_timestamp(created_at).timestamp())
@@ -0,0 +1,46 @@
+"""
+Tests for cell-based Reddit response extraction.
+"""
+
+from app.services.cell_extractors import extract_post_from_cells, filter_content_types
+
+
+def test_extract_post_from_cells():
+    """Test flattening a CellGroup's cells into a post object."""
+    cells = [
+        {"__typename": "MetadataCell", "authorName": "u/rider", "createdAt": "2024-01-15T10:30:45+0000"},
+        {"__typename": "TitleCell", "title": "Best helmet?"},
+        {"__typename": "ActionCell", "score": 42, "commentCount": 7},
+        {"__typename": "ImageCell", "subredditVisualName": "motorcycles"},
+    ]
+
+    post = extract_post_from_cells("t3_abc123", cells)
+
+    assert post["id"] == "abc123"
+    assert post["author"] == "rider"
+    assert post["created_utc"] == 1705314645
+    assert post["title"] == "Best helmet?"
+    assert post["score"] == 42
+    assert post["num_comments"] == 7
+    assert post["permalink"] == "/r/motorcycles/comments/abc123/"
+    assert post["url"] == "https://www.reddit.com/r/motorcycles/comments/abc123/"
+
+
+def test_extract_post_from_cells_requires_title():
+    """Test that posts without a title are dropped."""
+    assert extract_post_from_cells("t3_abc123", [{"__typename": "ActionCell", "score": 1}]) is None
+
+
+def test_filter_content_types():
+    """Test that ads are dropped and unfiltered responses are returned as is."""
+    post = {"__typename": "CellGroup", "groupId": "t3_abc123", "cells": []}
+    ad = {"__typename": "CellGroup", "groupId": "t3_ad", "adPayload": {}, "cells": []}
+
+    clean_response = {"data": [post], "meta": {"nextPage": "token"}}
+    assert filter_content_types(clean_response) is clean_response
+
+    filtered = filter_content_types({"data": [post, ad], "meta": {"nextPage": "token"}})
+    assert filtered["data"] == [post]
+    assert filtered["meta"] == {"nextPage": "token"}
+
+    assert filter_content_types({}) == {"data": []}
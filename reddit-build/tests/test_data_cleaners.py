@@ -0,0 +1,87 @@
+"""
+Tests for Reddit post and comment cleaning.
+"""
+
+from datetime import datetime, timezone
+
+from app.services.data_cleaners import (
+    clean_posts_comments_response,
+    extract_comment_content,
+    sanitize_reddit_content,
+)
+
+
+def _tree(comment_id, parent_id=None, depth=0, markdown="text"):
+    """Build a commentForest tree entry as returned by the posts/comments endpoint."""
+    return {
+        "depth": depth,
+        "parentId": parent_id,
+        "node": {
+            "id": comment_id,
+            "content": {"markdown": markdown},
+            "authorInfo": {"name": "rider"},
+            "score": 3,
+            "createdAt": "2024-01-15T10:30:45.000000+0000",
+        },
+    }
+
+
+def test_clean_posts_comments_response_builds_tree():
+    """Test that comments are nested under their parents in order."""
+    response = {"data": {"commentForest": {"trees": [
+        _tree("c1"),
+        _tree("c2", parent_id="c1", depth=1),
+        {"depth": 1, "parentId": "c1", "node": None},  # "more comments" placeholder
+        _tree("c3"),
+        _tree("c4", parent_id="c1", depth=1, markdown=""),
+        _tree("c5", parent_id="missing", depth=2),
+    ]}}}
+
+    roots = clean_posts_comments_response(response)
+
+    assert [c["id"] for c in roots] == ["c1", "c3", "c5"]
+    assert [c["id"] for c in roots[0]["children"]] == ["c2", "c4"]
+    assert roots[1]["children"] == []  # the LLM prompt describes children arrays on every comment
+    assert roots[0]["children"][1]["body"] == "[deleted]"
+    assert roots[0]["author"] == "rider"
+    assert roots[0]["date"] == datetime(2024, 1, 15, 10, 30, 45, tzinfo=timezone.utc)
+
+
+def test_clean_posts_comments_response_invalid_input():
+    """Test that malformed responses yield no comments."""
+    assert clean_posts_comments_response(None) == []
+    assert clean_posts_comments_response({"data": {"commentForest": {"trees": "nope"}}}) == []
+
+
+def test_extract_comment_content_prefers_markdown():
+    """Test that markdown wins over the other content formats."""
+    content = {"markdown": " **Great** bike ", "preview": "Great bike", "html": "<p>Great bike</p>"}
+    assert extract_comment_content(content) == "**Great** bike"
+
+
+def test_extract_comment_content_falls_back_to_html():
+    """Test that HTML content is stripped of tags and entities."""
+    content = {"markdown": "  ", "html": "<p>Tom &amp; Jerry&#39;s &lt;b&gt; &quot;bike&quot;</p>"}
+    assert extract_comment_content(content) == "Tom & Jerry's <b> \"bike\""
+
+
+def test_extract_comment_content_empty():
+    """Test that missing content yields an empty string."""
+    assert extract_comment_content({}) == ""
+    assert extract_comment_content({"markdown": "", "preview": " "}) == ""
+
+
+def test_sanitize_reddit_content():
+    """Test script removal, markdown stripping and whitespace normalization."""
+    content = "<script>alert(1)</script>**Bold**  and *italic*\n\nand ~~gone~~ javascript:void(0)"
+    assert sanitize_reddit_content(content) == "Bold and italic and gone void(0)"
+
+
+def test_extract_comment_content_decodes_entities_once():
+    """Test that escaped entities are not decoded twice."""
+    assert extract_comment_content({"html": "<p>&amp;#39; &amp;lt;</p>"}) == "&#39; &lt;"
+
+
+def test_sanitize_reddit_content_nested_markdown():
+    """Test that nested emphasis markers are all stripped."""
+    assert sanitize_reddit_content("***both*** and **~~struck~~**") == "both and struck"
@@ -2,9 +2,17 @@
 Test suite for Reddit Comment Analysis API.
 """
 
+import logging
+
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.exceptions import (
+    AIAnalysisException,
+    DataExtractionException,
+    RateLimitException,
+    RedditAPIException,
+)
 from app.main import app
 from app.models.schemas import ConfigurableAnalysisRequest
 
@@ -25,6 +33,93 @@ def test_health_endpoint():
     assert "timestamp" in data
 
 
+def test_request_id_header():
+    """Test that every response carries a request id header."""
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.headers["X-Request-ID"].startswith("req_")
+    assert response.headers["X-Request-ID"] != client.get("/health").headers["X-Request-ID"]
+
+
+def _get_raising(exc: Exception):
+    """Request a temporary route that raises exc and return the response."""
+
+    async def failing_route():
+        raise exc
+
+    app.add_api_route("/_test/raise", failing_route)
+    try:
+        return TestClient(app, raise_server_exceptions=False).get("/_test/raise")
+    finally:
+        app.router.routes = [
+            route for route in app.router.routes
+            if getattr(route, "path", None) != "/_test/raise"
+        ]
+
+
+def test_request_id_header_on_unhandled_error():
+    """Test that 500 responses from unhandled exceptions carry the request id header."""
+    response = _get_raising(ValueError("boom"))
+
+    assert response.status_code == 500
+    assert response.headers["X-Request-ID"].startswith("req_")
+    assert response.headers["X-Request-ID"] == response.json()["request_id"]
+
+
+@pytest.mark.parametrize(
+    "exc, status_code, retry_after, message, log_field",
+    [
+        (
+            RedditAPIException("down", endpoint="posts/comments"),
+            503,
+            60,
+            "Reddit service temporarily unavailable. Please try again later.",
+            ("endpoint", "posts/comments"),
+        ),
+        (
+            AIAnalysisException("timeout"),
+            502,
+            None,
+            "AI analysis service temporarily unavailable. Please try again later.",
+            ("model", "unknown"),
+        ),
+        (
+            DataExtractionException("bad cells", phase="cells"),
+            422,
+            None,
+            "Unable to process the requested data. Please check your parameters and try again.",
+            ("extraction_phase", "cells"),
+        ),
+        (
+            RateLimitException("slow down", service="reddit", retry_after=30),
+            429,
+            30,
+            "Rate limit exceeded. Please try again in 30 seconds.",
+            ("service", "reddit"),
+        ),
+    ],
+)
+def test_service_exception_handlers(caplog, exc, status_code, retry_after, message, log_field):
+    """Test the error response and log record for each service exception."""
+    with caplog.at_level(logging.WARNING, logger="app.main"):
+        response = _get_raising(exc)
+
+    assert response.status_code == status_code
+    data = response.json()
+    assert data["error_code"] == exc.error_code
+    assert data["message"] == message
+    assert data["request_id"] == response.headers["X-Request-ID"]
+    if retry_after is None:
+        assert "retry_after" not in data
+        assert "Retry-After" not in response.headers
+    else:
+        assert data["retry_after"] == retry_after
+        assert response.headers["Retry-After"] == str(retry_after)
+
+    record = next(r for r in caplog.records if getattr(r, "request_id", None) == data["request_id"])
+    assert getattr(record, log_field[0]) == log_field[1]
+
+
 def test_status_endpoint():
     """Test the status endpoint."""
     response = client.get("/status")
@@ -148,6 +243,19 @@ def test_cors_headers():
     # This is a basic check that the endpoint works with CORS middleware
 
 
+def test_gzip_compression():
+    """Test that large responses are gzipped and small ones are not."""
+    headers = {"Accept-Encoding": "gzip"}
+
+    response = client.get("/openapi.json", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+
+    response = client.get("/health", headers=headers)
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
  
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Tests for the shared Reddit API client used by the data collectors.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.config import get_settings
+from app.services.reddit_collector import (
+    SearchDataCollector,
+    SubredditDataCollector,
+    close_shared_client,
+)
+
+
+@pytest.fixture(autouse=True)
+def rapid_api_key(monkeypatch):
+    """Collectors refuse to open a client without a RapidAPI key."""
+    monkeypatch.setattr(get_settings(), "rapid_api_key", "test-key")
+
+
+async def _collector_client(collector_class):
+    """Open a collector and return the client it was given."""
+    async with collector_class() as collector:
+        return collector.client
+
+
+def test_collectors_share_one_client_per_loop():
+    """Test that collectors on the same loop reuse one client, left open by __aexit__."""
+
+    async def run():
+        first = await _collector_client(SubredditDataCollector)
+        second = await _collector_client(SearchDataCollector)
+        assert first is second
+        assert not first.is_closed
+        await close_shared_client()
+        assert first.is_closed
+
+    asyncio.run(run())
+
+
+def test_client_recreated_after_close():
+    """Test that a new client is created once the shared one has been closed."""
+
+    async def run():
+        first = await _collector_client(SubredditDataCollector)
+        await close_shared_client()
+        second = await _collector_client(SubredditDataCollector)
+        assert second is not first
+        assert not second.is_closed
+        await close_shared_client()
+
+    asyncio.run(run())
+
+
+def test_client_recreated_on_new_loop():
+    """Test that each event loop gets its own client and other loops' clients stay open."""
+
+    async def open_client():
+        return await _collector_client(SubredditDataCollector)
+
+    first_loop = asyncio.new_event_loop()
+    second_loop = asyncio.new_event_loop()
+    try:
+        first = first_loop.run_until_complete(open_client())
+        second = second_loop.run_until_complete(open_client())
+        assert second is not first
+        assert not first.is_closed
+
+        first_loop.run_until_complete(close_shared_client())
+        assert first.is_closed
+        assert not second.is_closed
+        second_loop.run_until_complete(close_shared_client())
+        assert second.is_closed
+    finally:
+        first_loop.close()
+        second_loop.close()
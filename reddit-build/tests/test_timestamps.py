@@ -0,0 +1,39 @@
+"""
+Tests for Reddit timestamp parsing.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services.timestamps import parse_reddit_timestamp, reddit_timestamp_to_epoch
+
+
+def test_parse_reddit_timestamp_matches_fromisoformat():
+    """Test the sliced parser against datetime.fromisoformat."""
+    for created_at in (
+        "2024-01-15T10:30:45+0000",
+        "2024-01-15T10:30:45.123+0000",
+        "2024-02-29T23:59:59.123456+0000",
+        "2024-01-15T10:30:45+00:00",
+        "2023-06-01T00:00:00-0500",
+    ):
+        expected = datetime.fromisoformat(created_at.replace("+0000", "+00:00"))
+        parsed = parse_reddit_timestamp(created_at)
+        assert parsed == expected
+        assert parsed.utcoffset() == expected.utcoffset()
+        assert reddit_timestamp_to_epoch(created_at) == int(expected.timestamp())
+
+
+def test_parse_reddit_timestamp_is_utc():
+    """Test that Reddit's own format yields an aware UTC datetime."""
+    assert parse_reddit_timestamp("2024-01-15T10:30:45+0000") == datetime(
+        2024, 1, 15, 10, 30, 45, tzinfo=timezone.utc
+    )
+
+
+def test_parse_reddit_timestamp_invalid():
+    """Test that malformed timestamps raise ValueError."""
+    for created_at in ("2024-13-15T10:30:45+0000", "garbage+0000", "not a date"):
+        with pytest.raises(ValueError):
+            parse_reddit_timestamp(created_at)